@@ -6,43 +6,57 @@
 Command Line Interface for Library Inventory Manager
 """
 
+import atexit
 import sys
 import os
 
-# Add parent directory to path to import library_manager
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from library_manager import Book, LibraryInventory
 
+# Status icons indexed by Book.is_available(): (issued, available)
+STATUS_ICONS = ("📤", "✅")
+
 
 def clear_screen():
-    """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    """Clear the terminal screen without spawning a subprocess where possible."""
+    if os.name == 'nt':
+        os.system('cls')
+    else:
+        sys.stdout.write('\x1b[2J\x1b[H')
+        sys.stdout.flush()
 
 
 def print_header():
     """Print the application header."""
-    print("=" * 60)
-    print(" " * 15 + "LIBRARY INVENTORY MANAGER")
-    print("=" * 60)
-    print()
+    lines = [
+        "=" * 60,
+        " " * 15 + "LIBRARY INVENTORY MANAGER",
+        "=" * 60,
+        "",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def print_menu():
     """Display the main menu."""
-    print("\n" + "─" * 60)
-    print("MAIN MENU")
-    print("─" * 60)
-    print("1. Add New Book")
-    print("2. Issue Book")
-    print("3. Return Book")
-    print("4. View All Books")
-    print("5. Search Book by Title")
-    print("6. Search Book by ISBN")
-    print("7. Search Book by Author")
-    print("8. View Statistics")
-    print("9. Exit")
-    print("─" * 60)
+    lines = [
+        "",
+        "─" * 60,
+        "MAIN MENU",
+        "─" * 60,
+        "1. Add New Book",
+        "2. Issue Book",
+        "3. Return Book",
+        "4. View All Books",
+        "5. Search Book by Title",
+        "6. Search Book by ISBN",
+        "7. Search Book by Author",
+        "8. View Statistics",
+        "9. Exit",
+        "─" * 60,
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def get_valid_input(prompt, input_type=str, allow_empty=False):
@@ -144,17 +158,16 @@ def return_book_cli(inventory):
 
 def display_books(books, message="BOOKS IN INVENTORY"):
     """Display a list of books."""
-    print("\n" + "─" * 60)
-    print(message)
-    print("─" * 60)
+    lines = ["", "─" * 60, message, "─" * 60]
     
     if not books:
-        print("📚 No books found.")
-        return
+        lines.append("📚 No books found.")
+    else:
+        for i, book in enumerate(books, 1):
+            lines.append(f"\n{i}. {STATUS_ICONS[book.is_available()]} {book}")
     
-    for i, book in enumerate(books, 1):
-        status_icon = "✅" if book.is_available() else "📤"
-        print(f"\n{i}. {status_icon} {book}")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def view_all_books_cli(inventory):
@@ -239,9 +252,22 @@ def main():
     """Main function to run the CLI application."""
     try:
         inventory = LibraryInventory()
+        atexit.register(inventory.flush)
+        
+        actions = {
+            '1': add_book_cli,
+            '2': issue_book_cli,
+            '3': return_book_cli,
+            '4': view_all_books_cli,
+            '5': search_by_title_cli,
+            '6': search_by_isbn_cli,
+            '7': search_by_author_cli,
+            '8': view_statistics_cli,
+        }
+        
+        print_header()
         
         while True:
-            print_header()
             print_menu()
             
             choice = get_valid_input("\nEnter your choice (1-9): ")
@@ -249,31 +275,20 @@ def main():
             if not choice:
                 continue
             
-            if choice == '1':
-                add_book_cli(inventory)
-            elif choice == '2':
-                issue_book_cli(inventory)
-            elif choice == '3':
-                return_book_cli(inventory)
-            elif choice == '4':
-                view_all_books_cli(inventory)
-            elif choice == '5':
-                search_by_title_cli(inventory)
-            elif choice == '6':
-                search_by_isbn_cli(inventory)
-            elif choice == '7':
-                search_by_author_cli(inventory)
-            elif choice == '8':
-                view_statistics_cli(inventory)
+            action = actions.get(choice)
+            if action:
+                action(inventory)
             elif choice == '9':
                 print("\n👋 Thank you for using Library Inventory Manager!")
                 print("Goodbye!\n")
+                inventory.flush()
                 sys.exit(0)
             else:
                 print("\n❌ Invalid choice. Please select 1-9.")
             
             input("\nPress Enter to continue...")
             clear_screen()
+            print_header()
             
     except KeyboardInterrupt:
         print("\n\n⚠️  Application interrupted by user.")
@@ -6,6 +6,10 @@ class Book:
     """
     Represents a book in the library inventory.
     
+    Instances use ``__slots__`` rather than a per-instance ``__dict__``,
+    which keeps large catalogs compact in memory. Availability is stored
+    as a bool; ``status`` is derived from it for display and JSON.
+    
     Attributes:
         title (str): The title of the book
         author (str): The author of the book
@@ -13,6 +17,8 @@ class Book:
         status (str): Current status - 'available' or 'issued'
     """
     
+    __slots__ = ('title', 'author', 'isbn', '_available')
+    
     def __init__(self, title, author, isbn, status="available"):
         """
         Initialize a Book object.
@@ -26,7 +32,16 @@ class Book:
         self.title = title
         self.author = author
         self.isbn = isbn
-        self.status = status
+        self._available = status == "available"
+    
+    @property
+    def status(self):
+        """str: Current status - 'available' or 'issued'."""
+        return "available" if self._available else "issued"
+    
+    @status.setter
+    def status(self, value):
+        self._available = value == "available"
     
     def __str__(self):
         """
@@ -67,8 +82,8 @@ class Book:
         Returns:
             bool: True if book was issued, False if already issued
         """
-        if self.status == "available":
-            self.status = "issued"
+        if self._available:
+            self._available = False
             return True
         return False
     
@@ -79,8 +94,8 @@ class Book:
         Returns:
             bool: True if book was returned, False if already available
         """
-        if self.status == "issued":
-            self.status = "available"
+        if not self._available:
+            self._available = True
             return True
         return False
     
@@ -91,4 +106,4 @@ class Book:
         Returns:
             bool: True if available, False otherwise
         """
-        return self.status == "available"
+        return self._available
@@ -2,22 +2,57 @@
 Library Inventory Manager module
 """
 
+import bisect
 import json
 import logging
+import os
 from pathlib import Path
 from .book import Book
 
-# Configure logging
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; large catalogs are then parsed in one go
+    ijson = None
+
+# Catalogs at least this large are streamed with ijson when it is installed;
+# smaller ones are cheaper to parse in a single call.
+STREAM_THRESHOLD_BYTES = 64 * 1024
+
+if ijson is not None:
+    _JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError)
+else:
+    _JSON_ERRORS = (json.JSONDecodeError,)
+
+# Configure logging. Only warnings and errors are recorded by default, and
+# the log file is not opened until the first record is written. Set
+# LIBRARY_MANAGER_DEBUG to also log informational messages to the console.
+_debug = bool(os.environ.get('LIBRARY_MANAGER_DEBUG'))
+_handlers = [logging.FileHandler('library_manager.log', delay=True)]
+if _debug:
+    _handlers.append(logging.StreamHandler())
+
 logging.basicConfig(
-    level=logging.INFO,
+    level=logging.INFO if _debug else logging.WARNING,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('library_manager.log'),
-        logging.StreamHandler()
-    ]
+    handlers=_handlers
 )
 
 logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO if _debug else logging.WARNING)
+
+
+class _BookEncoder(json.JSONEncoder):
+    """JSON encoder that serializes Book objects as they are streamed out."""
+    
+    def default(self, o):
+        if isinstance(o, Book):
+            return o.to_dict()
+        return super().default(o)
 
 
 class LibraryInventory:
@@ -37,6 +72,14 @@ class LibraryInventory:
             catalog_file (str): Path to the JSON catalog file
         """
         self.books = []
+        self._by_isbn = {}  # ISBN -> Book index for O(1) lookups
+        self._available_count = 0
+        # Lower-cased titles/authors, parallel to self.books, for searching
+        self._titles_lc = []
+        self._authors_lc = []
+        # Sorted (lower-cased title, ISBN) pairs for prefix searches
+        self._titles_sorted_lc = []
+        self._dirty = False  # True when in-memory changes are not yet saved
         self.catalog_file = Path(catalog_file)
         self.load_catalog()
         logger.info("Library Inventory initialized")
@@ -52,17 +95,31 @@ class LibraryInventory:
             bool: True if book was added successfully
         """
         try:
-            # Check if ISBN already exists
-            if any(b.isbn == book.isbn for b in self.books):
-                logger.warning(f"Book with ISBN {book.isbn} already exists")
+            # Check if ISBN already exists (O(1) membership test on the index)
+            if book.isbn in self._by_isbn:
+                logger.warning("Book with ISBN %s already exists", book.isbn)
                 return False
             
+            # Compute everything that can fail before touching any index, so a
+            # rejected book never leaves the parallel lists out of step
+            title_lc = book.title.lower()
+            author_lc = book.author.lower()
+            sort_key = (title_lc, book.isbn)
+            sort_pos = bisect.bisect_left(self._titles_sorted_lc, sort_key)
+            available = book.is_available()
+            
             self.books.append(book)
-            self.save_catalog()
-            logger.info(f"Book added: {book.title} (ISBN: {book.isbn})")
+            self._by_isbn[book.isbn] = book
+            self._titles_lc.append(title_lc)
+            self._authors_lc.append(author_lc)
+            self._titles_sorted_lc.insert(sort_pos, sort_key)
+            if available:
+                self._available_count += 1
+            self._dirty = True
+            logger.info("Book added: %s (ISBN: %s)", book.title, book.isbn)
             return True
         except Exception as e:
-            logger.error(f"Error adding book: {e}")
+            logger.error("Error adding book: %s", e)
             return False
     
     def search_by_title(self, title):
@@ -76,12 +133,42 @@ class LibraryInventory:
             list: List of matching Book objects
         """
         try:
-            results = [book for book in self.books 
-                      if title.lower() in book.title.lower()]
-            logger.info(f"Search by title '{title}': {len(results)} results found")
+            needle = title.lower()
+            results = [book for book, title_lc in zip(self.books, self._titles_lc)
+                       if needle in title_lc]
+            logger.info("Search by title '%s': %s results found", title, len(results))
+            return results
+        except Exception as e:
+            logger.error("Error searching by title: %s", e)
+            return []
+    
+    def search_by_title_prefix(self, prefix):
+        """
+        Search for books whose title starts with a prefix (case-insensitive).
+        
+        Uses binary search over a sorted title index, so the cost grows with
+        the number of matches rather than the size of the catalog.
+        
+        Args:
+            prefix (str): Title prefix to search for
+            
+        Returns:
+            list: List of matching Book objects, ordered by title
+        """
+        try:
+            needle = prefix.lower()
+            titles_sorted = self._titles_sorted_lc
+            start = bisect.bisect_left(titles_sorted, (needle,))
+            results = []
+            for i in range(start, len(titles_sorted)):
+                title_lc, isbn = titles_sorted[i]
+                if not title_lc.startswith(needle):
+                    break
+                results.append(self._by_isbn[isbn])
+            logger.info("Search by title prefix '%s': %s results found", prefix, len(results))
             return results
         except Exception as e:
-            logger.error(f"Error searching by title: {e}")
+            logger.error("Error searching by title prefix: %s", e)
             return []
     
     def search_by_isbn(self, isbn):
@@ -95,14 +182,14 @@ class LibraryInventory:
             Book or None: Book object if found, None otherwise
         """
         try:
-            for book in self.books:
-                if book.isbn == isbn:
-                    logger.info(f"Book found by ISBN {isbn}")
-                    return book
-            logger.info(f"No book found with ISBN {isbn}")
-            return None
+            book = self._by_isbn.get(isbn)
+            if book is not None:
+                logger.info("Book found by ISBN %s", isbn)
+            else:
+                logger.info("No book found with ISBN %s", isbn)
+            return book
         except Exception as e:
-            logger.error(f"Error searching by ISBN: {e}")
+            logger.error("Error searching by ISBN: %s", e)
             return None
     
     def search_by_author(self, author):
@@ -116,12 +203,13 @@ class LibraryInventory:
             list: List of matching Book objects
         """
         try:
-            results = [book for book in self.books 
-                      if author.lower() in book.author.lower()]
-            logger.info(f"Search by author '{author}': {len(results)} results found")
+            needle = author.lower()
+            results = [book for book, author_lc in zip(self.books, self._authors_lc)
+                       if needle in author_lc]
+            logger.info("Search by author '%s': %s results found", author, len(results))
             return results
         except Exception as e:
-            logger.error(f"Error searching by author: {e}")
+            logger.error("Error searching by author: %s", e)
             return []
     
     def display_all(self):
@@ -137,22 +225,66 @@ class LibraryInventory:
         """
         Save the inventory to a JSON file.
         
+        The catalog is written to a temporary file first and then atomically
+        renamed over the original, so a crash never leaves a partial catalog.
+        
         Returns:
             bool: True if saved successfully, False otherwise
         """
         try:
-            books_data = [book.to_dict() for book in self.books]
-            with open(self.catalog_file, 'w', encoding='utf-8') as file:
-                json.dump(books_data, file, indent=4, ensure_ascii=False)
-            logger.info(f"Catalog saved to {self.catalog_file}")
+            tmp_file = self.catalog_file.with_suffix('.tmp')
+            if orjson is not None:
+                tmp_file.write_bytes(orjson.dumps(
+                    self.books, default=Book.to_dict, option=orjson.OPT_INDENT_2
+                ))
+            else:
+                with open(tmp_file, 'w', encoding='utf-8') as file:
+                    json.dump(self.books, file, cls=_BookEncoder, indent=4, ensure_ascii=False)
+            os.replace(tmp_file, self.catalog_file)
+            self._dirty = False
+            logger.info("Catalog saved to %s", self.catalog_file)
             return True
         except IOError as e:
-            logger.error(f"IO Error saving catalog: {e}")
+            logger.error("IO Error saving catalog: %s", e)
             return False
         except Exception as e:
-            logger.error(f"Unexpected error saving catalog: {e}")
+            logger.error("Unexpected error saving catalog: %s", e)
             return False
     
+    def flush(self):
+        """
+        Save the inventory to disk if it has unsaved changes.
+        
+        Mutating methods only mark the inventory as dirty, so callers must
+        flush (or use the inventory as a context manager) to persist their
+        changes.
+        
+        Returns:
+            bool: True if nothing needed saving or it was saved successfully
+        """
+        if not self._dirty:
+            return True
+        return self.save_catalog()
+    
+    def __enter__(self):
+        """Return the inventory for use in a ``with`` block."""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Flush unsaved changes when leaving a ``with`` block."""
+        self.flush()
+        return False
+    
+    def _rebuild_index(self):
+        """Rebuild the lookup indices and availability count from the book list."""
+        self._by_isbn = {book.isbn: book for book in self.books}
+        self._titles_lc = [book.title.lower() for book in self.books]
+        self._authors_lc = [book.author.lower() for book in self.books]
+        self._titles_sorted_lc = sorted(
+            (title_lc, book.isbn) for title_lc, book in zip(self._titles_lc, self.books)
+        )
+        self._available_count = sum(1 for book in self.books if book.is_available())
+    
     def load_catalog(self):
         """
         Load the inventory from a JSON file.
@@ -162,36 +294,49 @@ class LibraryInventory:
         """
         try:
             if not self.catalog_file.exists():
-                logger.warning(f"Catalog file {self.catalog_file} not found. Creating new catalog.")
+                logger.warning("Catalog file %s not found. Creating new catalog.", self.catalog_file)
                 self.books = []
+                self._rebuild_index()
                 self.save_catalog()
                 return True
             
-            with open(self.catalog_file, 'r', encoding='utf-8') as file:
-                books_data = json.load(file)
+            if ijson is not None and self.catalog_file.stat().st_size >= STREAM_THRESHOLD_BYTES:
+                # Build books while parsing instead of materializing every dict first
+                with open(self.catalog_file, 'rb') as file:
+                    self.books = [Book(**book_dict) for book_dict in ijson.items(file, 'item')]
+            elif orjson is not None:
+                books_data = orjson.loads(self.catalog_file.read_bytes())
                 self.books = [Book(**book_dict) for book_dict in books_data]
+            else:
+                with open(self.catalog_file, 'r', encoding='utf-8') as file:
+                    books_data = json.load(file)
+                self.books = [Book(**book_dict) for book_dict in books_data]
+            self._rebuild_index()
             
-            logger.info(f"Catalog loaded: {len(self.books)} books")
+            logger.info("Catalog loaded: %s books", len(self.books))
             return True
             
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON decode error: {e}. Creating backup and new catalog.")
+        except _JSON_ERRORS as e:
+            logger.error("JSON decode error: %s. Creating backup and new catalog.", e)
             # Create backup of corrupted file
             if self.catalog_file.exists():
                 backup_file = self.catalog_file.with_suffix('.json.backup')
                 self.catalog_file.rename(backup_file)
             self.books = []
+            self._rebuild_index()
             self.save_catalog()
             return False
             
         except IOError as e:
-            logger.error(f"IO Error loading catalog: {e}")
+            logger.error("IO Error loading catalog: %s", e)
             self.books = []
+            self._rebuild_index()
             return False
             
         except Exception as e:
-            logger.error(f"Unexpected error loading catalog: {e}")
+            logger.error("Unexpected error loading catalog: %s", e)
             self.books = []
+            self._rebuild_index()
             return False
     
     def issue_book(self, isbn):
@@ -204,22 +349,19 @@ class LibraryInventory:
         Returns:
             bool: True if book was issued, False otherwise
         """
-        try:
-            book = self.search_by_isbn(isbn)
-            if book:
-                if book.issue():
-                    self.save_catalog()
-                    logger.info(f"Book issued: {book.title} (ISBN: {isbn})")
-                    return True
-                else:
-                    logger.warning(f"Book already issued: {book.title} (ISBN: {isbn})")
-                    return False
-            else:
-                logger.warning(f"Book not found with ISBN: {isbn}")
-                return False
-        except Exception as e:
-            logger.error(f"Error issuing book: {e}")
+        book = self._by_isbn.get(isbn)
+        if book is None:
+            logger.warning("Book not found with ISBN: %s", isbn)
             return False
+        
+        if book.issue():
+            self._available_count -= 1
+            self._dirty = True
+            logger.info("Book issued: %s (ISBN: %s)", book.title, isbn)
+            return True
+        
+        logger.warning("Book already issued: %s (ISBN: %s)", book.title, isbn)
+        return False
     
     def return_book(self, isbn):
         """
@@ -231,22 +373,19 @@ class LibraryInventory:
         Returns:
             bool: True if book was returned, False otherwise
         """
-        try:
-            book = self.search_by_isbn(isbn)
-            if book:
-                if book.return_book():
-                    self.save_catalog()
-                    logger.info(f"Book returned: {book.title} (ISBN: {isbn})")
-                    return True
-                else:
-                    logger.warning(f"Book was not issued: {book.title} (ISBN: {isbn})")
-                    return False
-            else:
-                logger.warning(f"Book not found with ISBN: {isbn}")
-                return False
-        except Exception as e:
-            logger.error(f"Error returning book: {e}")
+        book = self._by_isbn.get(isbn)
+        if book is None:
+            logger.warning("Book not found with ISBN: %s", isbn)
             return False
+        
+        if book.return_book():
+            self._available_count += 1
+            self._dirty = True
+            logger.info("Book returned: %s (ISBN: %s)", book.title, isbn)
+            return True
+        
+        logger.warning("Book was not issued: %s (ISBN: %s)", book.title, isbn)
+        return False
     
     def get_statistics(self):
         """
@@ -256,7 +395,7 @@ class LibraryInventory:
             dict: Dictionary with statistics
         """
         total = len(self.books)
-        available = sum(1 for book in self.books if book.is_available())
+        available = self._available_count
         issued = total - available
         
         return {
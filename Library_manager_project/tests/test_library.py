@@ -7,11 +7,10 @@ import json
 import os
 from pathlib import Path
 import sys
-
-# Add parent directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import tempfile
 
 from library_manager import Book, LibraryInventory
+from library_manager import inventory as inventory_module
 
 
 class TestBook(unittest.TestCase):
@@ -72,23 +71,50 @@ class TestBook(unittest.TestCase):
         self.assertTrue(self.book.is_available())
         self.book.issue()
         self.assertFalse(self.book.is_available())
+    
+    def test_book_issued_status(self):
+        """Test creating a book with an explicit issued status."""
+        book = Book("Issued Book", "Author", "2020202020", "issued")
+        self.assertFalse(book.is_available())
+        self.assertEqual(book.to_dict()['status'], "issued")
+        self.assertTrue(book.return_book())
+        self.assertEqual(book.status, "available")
+    
+    def test_book_identity_equality(self):
+        """Test that books are hashable and compare by identity."""
+        twin = Book("Test Book", "Test Author", "1234567890")
+        self.assertNotEqual(self.book, twin)
+        self.assertEqual(len({self.book, twin}), 2)
+        self.assertIn(self.book, {self.book: True})
+    
+    def test_book_has_no_instance_dict(self):
+        """Test that books are slotted and carry no per-instance dict."""
+        self.assertFalse(hasattr(self.book, '__dict__'))
+        with self.assertRaises(AttributeError):
+            self.book.publisher = "Unknown"
+
+
+class DummyInventory(LibraryInventory):
+    """LibraryInventory that starts empty and never touches the disk."""
+    
+    def save_catalog(self):
+        """Discard the save, only marking the inventory as clean."""
+        self._dirty = False
+        return True
+    
+    def load_catalog(self):
+        """Start from an empty catalog."""
+        self.books = []
+        self._rebuild_index()
+        return True
 
 
 class TestLibraryInventory(unittest.TestCase):
-    """Test cases for the LibraryInventory class."""
+    """Test cases for the LibraryInventory class, using an in-memory catalog."""
     
     def setUp(self):
         """Set up test fixtures."""
-        self.test_catalog = "test_catalog.json"
-        self.inventory = LibraryInventory(self.test_catalog)
-        self.inventory.books = []  # Clear any existing books
-    
-    def tearDown(self):
-        """Clean up test files."""
-        if Path(self.test_catalog).exists():
-            os.remove(self.test_catalog)
-        if Path(self.test_catalog + '.backup').exists():
-            os.remove(self.test_catalog + '.backup')
+        self.inventory = DummyInventory(self.id())
     
     def test_add_book(self):
         """Test adding a book to inventory."""
@@ -105,6 +131,24 @@ class TestLibraryInventory(unittest.TestCase):
         result = self.inventory.add_book(book2)
         self.assertFalse(result)
         self.assertEqual(len(self.inventory.books), 1)
+        self.assertIs(self.inventory.search_by_isbn("2222222222"), book1)
+        self.assertEqual(self.inventory.search_by_title("Book Two"), [])
+        self.assertEqual(self.inventory.get_statistics()['available'], 1)
+    
+    def test_rejected_book_leaves_indices_aligned(self):
+        """Test that a book failing mid-add is not partially registered."""
+        self.assertFalse(self.inventory.add_book(Book(None, "Author B", "2626262626")))
+        self.assertTrue(self.inventory.add_book(Book("Gamma", "Author C", "2727272727")))
+        
+        self.assertEqual(len(self.inventory.books), 1)
+        self.assertIsNone(self.inventory.search_by_isbn("2626262626"))
+        self.assertEqual([book.isbn for book in self.inventory.search_by_title("gamma")],
+                         ["2727272727"])
+        self.assertEqual([book.isbn for book in self.inventory.search_by_author("author c")],
+                         ["2727272727"])
+        self.assertEqual([book.isbn for book in self.inventory.search_by_title_prefix("gam")],
+                         ["2727272727"])
+        self.assertEqual(self.inventory.get_statistics()['available'], 1)
     
     def test_search_by_title(self):
         """Test searching books by title."""
@@ -117,6 +161,18 @@ class TestLibraryInventory(unittest.TestCase):
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0].title, "Python Programming")
     
+    def test_search_by_title_prefix(self):
+        """Test searching books by title prefix."""
+        self.inventory.add_book(Book("Python Tricks", "Dan Bader", "2121212121"))
+        self.inventory.add_book(Book("Learning Python", "Mark Lutz", "2323232323"))
+        self.inventory.add_book(Book("python Crash Course", "Eric Matthes", "2424242424"))
+        self.inventory.add_book(Book("Pythonic Code", "Author", "2525252525"))
+        
+        results = self.inventory.search_by_title_prefix("PYTHON")
+        self.assertEqual([book.isbn for book in results],
+                         ["2424242424", "2121212121", "2525252525"])
+        self.assertEqual(self.inventory.search_by_title_prefix("Rust"), [])
+    
     def test_search_by_isbn(self):
         """Test searching book by ISBN."""
         book = Book("Data Science", "Jane Smith", "5555555555")
@@ -144,6 +200,8 @@ class TestLibraryInventory(unittest.TestCase):
         result = self.inventory.issue_book("8888888888")
         self.assertTrue(result)
         self.assertEqual(book.status, "issued")
+        self.assertFalse(self.inventory.issue_book("8888888888"))
+        self.assertFalse(self.inventory.issue_book("0000000000"))
     
     def test_return_book(self):
         """Test returning a book."""
@@ -154,16 +212,8 @@ class TestLibraryInventory(unittest.TestCase):
         result = self.inventory.return_book("9999999999")
         self.assertTrue(result)
         self.assertEqual(book.status, "available")
-    
-    def test_save_and_load_catalog(self):
-        """Test saving and loading catalog."""
-        book = Book("Persistent Book", "Author", "1010101010")
-        self.inventory.add_book(book)
-        
-        # Create new inventory instance
-        new_inventory = LibraryInventory(self.test_catalog)
-        self.assertEqual(len(new_inventory.books), 1)
-        self.assertEqual(new_inventory.books[0].title, "Persistent Book")
+        self.assertFalse(self.inventory.return_book("9999999999"))
+        self.assertFalse(self.inventory.return_book("0000000000"))
     
     def test_get_statistics(self):
         """Test getting inventory statistics."""
@@ -179,6 +229,98 @@ class TestLibraryInventory(unittest.TestCase):
         self.assertEqual(stats['issued'], 1)
 
 
+class TestCatalogPersistence(unittest.TestCase):
+    """Test cases for saving and loading the catalog file."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary directory shared by all tests in the class."""
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the temporary directory and every catalog written to it."""
+        cls.tmp_dir.cleanup()
+    
+    def setUp(self):
+        """Set up test fixtures with a fresh catalog path for each test."""
+        self.test_catalog = os.path.join(self.tmp_dir.name, f"{self._testMethodName}.json")
+        self.inventory = LibraryInventory(self.test_catalog)
+    
+    def test_indices_rebuilt_on_load(self):
+        """Test that every lookup index is rebuilt from a catalog on disk."""
+        self.inventory.add_book(Book("Learning PYTHON", "Mark Lutz", "1717171717"))
+        self.inventory.add_book(Book("Fluent Python", "Luciano Ramalho", "1818181818", "issued"))
+        self.inventory.flush()
+        
+        new_inventory = LibraryInventory(self.test_catalog)
+        self.assertEqual(new_inventory.search_by_isbn("1717171717").title, "Learning PYTHON")
+        self.assertIsNone(new_inventory.search_by_isbn("0000000000"))
+        self.assertFalse(new_inventory.add_book(Book("Dup", "Author", "1717171717")))
+        self.assertEqual(len(new_inventory.search_by_title("python")), 2)
+        self.assertEqual(new_inventory.search_by_author("LUTZ")[0].isbn, "1717171717")
+        self.assertEqual(new_inventory.search_by_title_prefix("fluent")[0].isbn, "1818181818")
+        self.assertEqual(new_inventory.get_statistics(),
+                         {'total': 2, 'available': 1, 'issued': 1})
+        new_inventory.return_book("1818181818")
+        self.assertEqual(new_inventory.get_statistics()['available'], 2)
+    
+    def test_save_and_load_catalog(self):
+        """Test saving and loading catalog."""
+        book = Book("Persistent Book", "Author", "1010101010")
+        self.inventory.add_book(book)
+        self.inventory.flush()
+        
+        # Create new inventory instance
+        new_inventory = LibraryInventory(self.test_catalog)
+        self.assertEqual(len(new_inventory.books), 1)
+        self.assertEqual(new_inventory.books[0].title, "Persistent Book")
+        
+        with open(self.test_catalog, encoding='utf-8') as file:
+            self.assertEqual(json.load(file), [book.to_dict()])
+    
+    def test_load_corrupted_catalog(self):
+        """Test that a corrupted catalog is backed up and replaced."""
+        with open(self.test_catalog, 'w', encoding='utf-8') as file:
+            file.write("{not valid json")
+        
+        new_inventory = LibraryInventory(self.test_catalog)
+        self.assertEqual(new_inventory.books, [])
+        self.assertTrue(Path(self.test_catalog + '.backup').exists())
+        with open(self.test_catalog, encoding='utf-8') as file:
+            self.assertEqual(json.load(file), [])
+    
+    @unittest.skipIf(inventory_module.ijson is None, "ijson not installed")
+    def test_load_large_catalog_streaming(self):
+        """Test loading a catalog above the streaming threshold."""
+        count = 2000
+        for i in range(count):
+            self.inventory.add_book(Book(f"Book {i}", "Author", f"isbn-{i}", "issued"))
+        self.inventory.flush()
+        self.assertGreaterEqual(os.path.getsize(self.test_catalog),
+                                inventory_module.STREAM_THRESHOLD_BYTES)
+        
+        new_inventory = LibraryInventory(self.test_catalog)
+        self.assertEqual(len(new_inventory.books), count)
+        self.assertEqual(new_inventory.search_by_isbn("isbn-1999").title, "Book 1999")
+        self.assertEqual(new_inventory.get_statistics()['issued'], count)
+    
+    def test_changes_saved_only_on_flush(self):
+        """Test that mutations are written to disk only when flushed."""
+        self.inventory.add_book(Book("Buffered Book", "Author", "1414141414"))
+        self.assertEqual(len(LibraryInventory(self.test_catalog).books), 0)
+        
+        self.assertTrue(self.inventory.flush())
+        self.assertEqual(len(LibraryInventory(self.test_catalog).books), 1)
+    
+    def test_context_manager_flushes(self):
+        """Test that leaving a with block saves pending changes."""
+        with LibraryInventory(self.test_catalog) as inventory:
+            inventory.add_book(Book("Managed Book", "Author", "2828282828"))
+        
+        self.assertEqual(LibraryInventory(self.test_catalog).books[0].isbn, "2828282828")
+
+
 def run_tests():
     """Run all tests."""
     loader = unittest.TestLoader()
@@ -186,6 +328,7 @@ def run_tests():
     
     suite.addTests(loader.loadTestsFromTestCase(TestBook))
     suite.addTests(loader.loadTestsFromTestCase(TestLibraryInventory))
+    suite.addTests(loader.loadTestsFromTestCase(TestCatalogPersistence))
     
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)